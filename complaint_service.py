@@ -12,6 +12,10 @@ from models.complaint_classifier import ComplaintClassifier
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import hashlib
+import hmac
+
+# Upper bound on cached predictions; cleared wholesale when full
+PREDICTION_CACHE_SIZE = 4096
 
 
 class ComplaintService:
@@ -21,19 +25,85 @@ class ComplaintService:
         """Initialize the complaint service"""
         self.db = Database(db_path)
         self.classifier = ComplaintClassifier(model_path)
-        
+        # Cache of processed text -> (category, confidence, priority) so
+        # duplicate descriptions (spam, form retries) skip the classifier
+        self._prediction_cache = {}
+
         # Load or train the model
         if os.path.exists(model_path):
             self.classifier.load_model()
         else:
             print("Training new model...")
             self.classifier.train(save_model=True)
-    
+
+        self._ensure_indexes()
+        self._load_lookup_maps()
+
+    def _load_lookup_maps(self):
+        """Cache the fixed category and department lookups
+
+        Categories and departments are seed data that changes rarely; call
+        this again if an admin edits them.
+        """
+        self._category_ids = {
+            row['name']: row['category_id']
+            for row in self.db.execute_query("SELECT name, category_id FROM categories")
+        }
+        self._department_ids = {
+            row['category_id']: row['department_id']
+            for row in self.db.execute_query(
+                "SELECT category_id, department_id FROM departments"
+            )
+        }
+
+    def _ensure_indexes(self):
+        """Create indexes backing the hot dashboard queries (idempotent)"""
+        # Covers the assignments->complaints join in get_complaints_by_department
+        self.db.execute_update("""
+            CREATE INDEX IF NOT EXISTS idx_assignments_department
+            ON assignments(department_id, complaint_id)
+        """)
+        # Covers the priority/recency ordering of the same query
+        self.db.execute_update("""
+            CREATE INDEX IF NOT EXISTS idx_complaints_priority_created
+            ON complaints(priority, created_at DESC)
+        """)
+
+    def _hash_password(self, password: str, salt: bytes = None) -> str:
+        """Hash a password with scrypt and a per-user random salt
+
+        Stored as 'salt_hex$hash_hex' so it fits the existing
+        password_hash TEXT column.
+        """
+        if salt is None:
+            salt = os.urandom(16)
+        key = hashlib.scrypt(
+            password.encode(), salt=salt, n=2**14, r=8, p=1, dklen=32
+        )
+        return f"{salt.hex()}${key.hex()}"
+
+    def verify_password(self, password: str, stored_hash: str) -> bool:
+        """Check a password against a stored salt$hash value
+
+        Hashes in any other format (e.g. legacy unsalted entries) fail
+        verification instead of raising.
+        """
+        if '$' not in stored_hash:
+            return False
+        salt_hex, _ = stored_hash.split('$', 1)
+        try:
+            salt = bytes.fromhex(salt_hex)
+        except ValueError:
+            return False
+        return hmac.compare_digest(
+            self._hash_password(password, salt), stored_hash
+        )
+
     def register_user(self, name: str, email: str, password: str, role: str = 'citizen') -> int:
         """Register a new user"""
         # Hash password
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
-        
+        password_hash = self._hash_password(password)
+
         query = """
             INSERT INTO users (name, email, password_hash, role)
             VALUES (?, ?, ?, ?)
@@ -46,23 +116,34 @@ class ComplaintService:
             print(f"Error registering user: {e}")
             return -1
     
-    def submit_complaint(self, user_id: int, title: str, description: str, 
+    def _classify(self, description: str) -> tuple:
+        """Classify a description, reusing cached results for duplicate texts"""
+        cache_key = self.classifier.preprocess_text(description)
+        cached = self._prediction_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # The cache key doubles as the preprocessed text, so the
+        # description is only cleaned once per classification
+        category_name, confidence, priority = self.classifier.predict_with_priority(
+            description, processed_text=cache_key
+        )
+
+        if len(self._prediction_cache) >= PREDICTION_CACHE_SIZE:
+            self._prediction_cache.clear()
+        self._prediction_cache[cache_key] = (category_name, confidence, priority)
+
+        return category_name, confidence, priority
+
+    def submit_complaint(self, user_id: int, title: str, description: str,
                         location: str = None) -> Dict[str, Any]:
         """Submit a new complaint with AI categorization"""
-        
+
         # Use AI to categorize the complaint
-        category_name, confidence = self.classifier.predict(description)
-        priority = self.classifier.predict_priority(description, category_name)
-        
-        # Get category ID
-        category_query = "SELECT category_id FROM categories WHERE name = ?"
-        categories = self.db.execute_query(category_query, (category_name,))
-        
-        if not categories:
-            category_id = None
-        else:
-            category_id = categories[0]['category_id']
-        
+        category_name, confidence, priority = self._classify(description)
+
+        category_id = self._category_ids.get(category_name)
+
         # Insert complaint
         complaint_query = """
             INSERT INTO complaints 
@@ -76,17 +157,13 @@ class ComplaintService:
         )
         
         # Auto-assign to department
-        if category_id:
-            dept_query = "SELECT department_id FROM departments WHERE category_id = ?"
-            departments = self.db.execute_query(dept_query, (category_id,))
-            
-            if departments:
-                dept_id = departments[0]['department_id']
-                assign_query = """
-                    INSERT INTO assignments (complaint_id, department_id)
-                    VALUES (?, ?)
-                """
-                self.db.execute_update(assign_query, (complaint_id, dept_id))
+        dept_id = self._department_ids.get(category_id)
+        if dept_id:
+            assign_query = """
+                INSERT INTO assignments (complaint_id, department_id)
+                VALUES (?, ?)
+            """
+            self.db.execute_update(assign_query, (complaint_id, dept_id))
         
         return {
             'complaint_id': complaint_id,
@@ -96,6 +173,63 @@ class ComplaintService:
             'status': 'Submitted'
         }
     
+    def submit_complaints_bulk(self, complaints: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Submit multiple complaints with a single batched classifier pass
+
+        Each entry needs 'user_id', 'title' and 'description'; 'location'
+        is optional.
+        """
+        if not complaints:
+            return []
+
+        # Classify all descriptions in one pipeline pass; priorities come
+        # from the same preprocessed text the single-submit path uses
+        descriptions = [c['description'] for c in complaints]
+        predictions = self.classifier.predict_batch_with_priority(descriptions)
+
+        complaint_rows = []
+        for complaint, (category_name, confidence, priority) in zip(complaints, predictions):
+            category_id = self._category_ids.get(category_name)
+            complaint_rows.append(
+                (complaint['user_id'], complaint['title'], complaint['description'],
+                 complaint.get('location'), category_id, priority,
+                 category_name, confidence)
+            )
+
+        # Insert all complaints in one transaction
+        complaint_query = """
+            INSERT INTO complaints
+            (user_id, title, description, location, category_id, priority, status)
+            VALUES (?, ?, ?, ?, ?, ?, 'Submitted')
+        """
+        complaint_ids = self.db.execute_insert_many(
+            complaint_query, [row[:6] for row in complaint_rows]
+        )
+
+        # Auto-assign to departments with a single executemany
+        assignment_rows = [
+            (complaint_id, self._department_ids[row[4]])
+            for complaint_id, row in zip(complaint_ids, complaint_rows)
+            if row[4] is not None and row[4] in self._department_ids
+        ]
+        if assignment_rows:
+            assign_query = """
+                INSERT INTO assignments (complaint_id, department_id)
+                VALUES (?, ?)
+            """
+            self.db.execute_many(assign_query, assignment_rows)
+
+        return [
+            {
+                'complaint_id': complaint_id,
+                'category': row[6],
+                'priority': row[5],
+                'confidence': row[7],
+                'status': 'Submitted'
+            }
+            for complaint_id, row in zip(complaint_ids, complaint_rows)
+        ]
+
     def get_complaint_details(self, complaint_id: int) -> Optional[Dict[str, Any]]:
         """Retrieve details of a specific complaint"""
         query = """
@@ -205,37 +339,37 @@ class ComplaintService:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get system statistics for dashboard"""
-        stats = {}
-        
-        # Total complaints
-        total_query = "SELECT COUNT(*) as total FROM complaints"
-        stats['total_complaints'] = self.db.execute_query(total_query)[0]['total']
-        
-        # Complaints by status
-        status_query = """
-            SELECT status, COUNT(*) as count 
-            FROM complaints 
+        # One round trip instead of four: each grouped select is unioned
+        # into (dimension, key, count) rows and bucketed back in Python
+        query = """
+            SELECT 'status' as dim, status as key, COUNT(*) as count
+            FROM complaints
             GROUP BY status
-        """
-        stats['by_status'] = self.db.execute_query(status_query)
-        
-        # Complaints by category
-        category_query = """
-            SELECT cat.name as category, COUNT(*) as count
+            UNION ALL
+            SELECT 'priority', priority, COUNT(*)
+            FROM complaints
+            GROUP BY priority
+            UNION ALL
+            SELECT 'category', cat.name, COUNT(*)
             FROM complaints c
             LEFT JOIN categories cat ON c.category_id = cat.category_id
             GROUP BY cat.name
         """
-        stats['by_category'] = self.db.execute_query(category_query)
-        
-        # Complaints by priority
-        priority_query = """
-            SELECT priority, COUNT(*) as count
-            FROM complaints
-            GROUP BY priority
-        """
-        stats['by_priority'] = self.db.execute_query(priority_query)
-        
+        rows = self.db.execute_query(query)
+
+        stats = {'by_status': [], 'by_category': [], 'by_priority': []}
+        for row in rows:
+            if row['dim'] == 'status':
+                stats['by_status'].append({'status': row['key'], 'count': row['count']})
+            elif row['dim'] == 'priority':
+                stats['by_priority'].append({'priority': row['key'], 'count': row['count']})
+            else:
+                stats['by_category'].append({'category': row['key'], 'count': row['count']})
+
+        # The status counts partition all complaints, so the total falls
+        # out without another scan
+        stats['total_complaints'] = sum(item['count'] for item in stats['by_status'])
+
         return stats
 
 
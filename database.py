@@ -9,106 +9,148 @@ from typing import Optional, List, Dict, Any
 import os
 
 
+# Full schema DDL, executed as one script on first run. sqlite does not
+# auto-index foreign-key columns, so the common filters and joins get
+# explicit indexes here.
+SCHEMA_DDL = """
+    CREATE TABLE IF NOT EXISTS users (
+        user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        role TEXT DEFAULT 'citizen',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS categories (
+        category_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL,
+        description TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS departments (
+        department_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        category_id INTEGER,
+        email TEXT,
+        FOREIGN KEY (category_id) REFERENCES categories(category_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS complaints (
+        complaint_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        description TEXT NOT NULL,
+        location TEXT,
+        category_id INTEGER,
+        priority TEXT DEFAULT 'Medium',
+        status TEXT DEFAULT 'Submitted',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(user_id),
+        FOREIGN KEY (category_id) REFERENCES categories(category_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS assignments (
+        assignment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        complaint_id INTEGER NOT NULL,
+        department_id INTEGER NOT NULL,
+        assigned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (complaint_id) REFERENCES complaints(complaint_id),
+        FOREIGN KEY (department_id) REFERENCES departments(department_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS attachments (
+        attachment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        complaint_id INTEGER NOT NULL,
+        file_path TEXT NOT NULL,
+        uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (complaint_id) REFERENCES complaints(complaint_id)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_complaints_user ON complaints(user_id);
+    CREATE INDEX IF NOT EXISTS idx_complaints_status ON complaints(status);
+    CREATE INDEX IF NOT EXISTS idx_complaints_category ON complaints(category_id);
+    CREATE INDEX IF NOT EXISTS idx_assignments_complaint ON assignments(complaint_id);
+    CREATE INDEX IF NOT EXISTS idx_attachments_complaint ON attachments(complaint_id);
+"""
+
+
 class Database:
     """Database manager for the complaint management system"""
     
     def __init__(self, db_path: str = "complaint_system.db"):
-        """Initialize database connection"""
+        """Initialize database connection
+
+        Pass db_path=':memory:' for throwaway test runs; schema init and
+        seeding skip all disk fsyncs, and snapshot() can persist the
+        result to a file afterwards if needed.
+        """
         self.db_path = db_path
         self.conn = None
         self.cursor = None
         
     def connect(self):
-        """Establish database connection"""
-        self.conn = sqlite3.connect(self.db_path)
+        """Establish the database connection (no-op if already open)
+
+        The connection is opened once and reused for the lifetime of the
+        Database object; sqlite3.connect per query costs more than most
+        of the short queries themselves.
+        """
+        if self.conn is not None:
+            return
+        # cached_statements sizes the per-connection prepared-statement
+        # cache; all queries use ? placeholders with stable SQL text, so
+        # repeat calls skip the SQL parser entirely
+        self.conn = sqlite3.connect(self.db_path, cached_statements=256)
         self.conn.row_factory = sqlite3.Row
+        # WAL lets readers proceed while a write is in flight, and NORMAL
+        # drops the extra fsync per commit that FULL pays in WAL mode
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # 20MB page cache, spill temp structures to RAM, and mmap the
+        # database file so hot pages come from the OS page cache
+        self.conn.execute("PRAGMA cache_size=-20000")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        # sqlite leaves the declared FOREIGN KEY constraints unenforced
+        # unless this is switched on per connection
+        self.conn.execute("PRAGMA foreign_keys=ON")
         self.cursor = self.conn.cursor()
         
     def close(self):
         """Close database connection"""
         if self.conn:
             self.conn.close()
-            
+            self.conn = None
+            self.cursor = None
+
+    def snapshot(self, path: str):
+        """Copy the live database to a file using sqlite's backup API
+
+        Mainly useful with an in-memory database: run fast, then persist
+        the final state in one pass instead of paying per-write fsyncs.
+        """
+        self.connect()
+        with sqlite3.connect(path) as dst:
+            self.conn.backup(dst)
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def initialize_schema(self):
         """Create all required tables"""
         self.connect()
-        
-        # Users table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                user_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                role TEXT DEFAULT 'citizen',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Categories table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS categories (
-                category_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                description TEXT
-            )
-        """)
-        
-        # Departments table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS departments (
-                department_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                category_id INTEGER,
-                email TEXT,
-                FOREIGN KEY (category_id) REFERENCES categories(category_id)
-            )
-        """)
-        
-        # Complaints table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS complaints (
-                complaint_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                title TEXT NOT NULL,
-                description TEXT NOT NULL,
-                location TEXT,
-                category_id INTEGER,
-                priority TEXT DEFAULT 'Medium',
-                status TEXT DEFAULT 'Submitted',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(user_id),
-                FOREIGN KEY (category_id) REFERENCES categories(category_id)
-            )
-        """)
-        
-        # Assignments table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS assignments (
-                assignment_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                complaint_id INTEGER NOT NULL,
-                department_id INTEGER NOT NULL,
-                assigned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (complaint_id) REFERENCES complaints(complaint_id),
-                FOREIGN KEY (department_id) REFERENCES departments(department_id)
-            )
-        """)
-        
-        # Attachments table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS attachments (
-                attachment_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                complaint_id INTEGER NOT NULL,
-                file_path TEXT NOT NULL,
-                uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (complaint_id) REFERENCES complaints(complaint_id)
-            )
-        """)
-        
+        # One executescript call parses and runs the whole DDL block in a
+        # single pass instead of a round-trip per statement
+        self.conn.executescript(SCHEMA_DDL)
         self.conn.commit()
         print("Database schema initialized successfully")
-        
+
     def seed_data(self):
         """Insert initial data for categories and departments"""
         self.connect()
@@ -122,15 +164,13 @@ class Database:
             ('Other', 'Miscellaneous issues not covered in other categories')
         ]
         
-        for cat in categories:
-            try:
-                self.cursor.execute(
-                    "INSERT INTO categories (name, description) VALUES (?, ?)", 
-                    cat
-                )
-            except sqlite3.IntegrityError:
-                pass  # Category already exists
-        
+        # OR IGNORE skips rows that already exist without the cost of
+        # raising and catching IntegrityError per row
+        self.cursor.executemany(
+            "INSERT OR IGNORE INTO categories (name, description) VALUES (?, ?)",
+            categories
+        )
+
         # Insert departments
         departments = [
             ('Water Department', 1, 'water@example.com'),
@@ -140,34 +180,96 @@ class Database:
             ('General Administration', 5, 'admin@example.com')
         ]
         
-        for dept in departments:
-            try:
-                self.cursor.execute(
-                    "INSERT INTO departments (name, category_id, email) VALUES (?, ?, ?)",
-                    dept
-                )
-            except sqlite3.IntegrityError:
-                pass  # Department already exists
-        
+        self.cursor.executemany(
+            "INSERT OR IGNORE INTO departments (name, category_id, email) VALUES (?, ?, ?)",
+            departments
+        )
+
         self.conn.commit()
         print("Seed data inserted successfully")
         
-    def execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
-        """Execute a SELECT query and return results as list of dictionaries"""
+    def execute_query(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Execute a SELECT query and return the result rows
+
+        Rows are sqlite3.Row objects, which index by column name like the
+        dicts previously returned but without allocating a dict per row.
+        """
         self.connect()
         self.cursor.execute(query, params)
-        rows = self.cursor.fetchall()
-        self.close()
-        return [dict(row) for row in rows]
+        return self.cursor.fetchall()
     
+    def iter_query(self, query: str, params: tuple = (), chunk_size: int = 500):
+        """Execute a SELECT query and yield rows in fixed-size chunks
+
+        Unlike execute_query, peak memory stays bounded by chunk_size no
+        matter how large the result set grows; use this for 'all
+        complaints' style admin queries.
+        """
+        self.connect()
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            for row in rows:
+                yield row
+
     def execute_update(self, query: str, params: tuple = ()) -> int:
         """Execute an INSERT/UPDATE/DELETE query and return last row id"""
         self.connect()
         self.cursor.execute(query, params)
         self.conn.commit()
-        last_id = self.cursor.lastrowid
-        self.close()
-        return last_id
+        return self.cursor.lastrowid
+
+    def bulk_update(self, statements: List[tuple]) -> None:
+        """Run several (query, params) write statements in one transaction
+
+        One commit (and therefore one fsync) for the whole batch instead
+        of one per statement; rolls back the batch on failure.
+        """
+        self.connect()
+        try:
+            for query, params in statements:
+                self.cursor.execute(query, params)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def execute_many(self, query: str, params_list: List[tuple]) -> int:
+        """Execute the same statement for many rows in a single transaction
+
+        Rolls back the whole batch on failure so a mid-batch error never
+        leaves partial rows in an open transaction.
+        """
+        self.connect()
+        try:
+            self.cursor.executemany(query, params_list)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return self.cursor.rowcount
+
+    def execute_insert_many(self, query: str, params_list: List[tuple]) -> List[int]:
+        """Run an INSERT for many rows in one transaction, returning row ids
+
+        Uses individual execute calls (executemany does not expose per-row
+        lastrowid) but commits only once for the whole batch, rolling the
+        batch back if any row fails.
+        """
+        self.connect()
+        row_ids = []
+        try:
+            for params in params_list:
+                self.cursor.execute(query, params)
+                row_ids.append(self.cursor.lastrowid)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return row_ids
 
 
 if __name__ == "__main__":
@@ -6,34 +6,131 @@ Creates charts and graphs for the project report
 import sys
 sys.path.append('/home/ubuntu/complaint_system')
 
+import matplotlib
+# Headless raster backend; without this a DISPLAY pulls in a GUI toolkit
+# that is never used here
+matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import numpy as np
+import json
+import os
+from multiprocessing import Pool
 from backend.complaint_service import ComplaintService
 from models.complaint_classifier import ComplaintClassifier
 import seaborn as sns
-from sklearn.metrics import confusion_matrix, classification_report
-import pandas as pd
 
 # Set style
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (10, 6)
 plt.rcParams['font.size'] = 10
+# Pin the font family so the many weight='bold' lookups resolve without
+# fallback scans, and trim Agg's per-path work
+plt.rcParams.update({
+    'font.family': 'DejaVu Sans',
+    'text.hinting': 'none',
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
 
+# Shared savefig settings: 150 DPI keeps report quality at a quarter of
+# the pixels, and compress_level=1 trades a few KB of PNG size for a
+# much faster deflate pass
+SAVE_KW = dict(dpi=150, bbox_inches='tight',
+               pil_kwargs={'compress_level': 1, 'optimize': False})
+
+
+STATS_CACHE_PATH = '/tmp/stats_cache.json'
+
+
+def cached_stats(service, db_path):
+    """Return get_statistics(), cached in a sidecar JSON keyed by DB mtime
+
+    Re-running this script while tuning chart styles hits the same
+    unchanged database every time; on a cache hit the grouped queries
+    are replaced by one small JSON load.
+    """
+    mtime = os.path.getmtime(db_path)
+    try:
+        with open(STATS_CACHE_PATH) as f:
+            cached = json.load(f)
+        if cached.get('db_mtime') == mtime:
+            return cached['stats']
+    except (OSError, ValueError):
+        pass
 
-def create_category_distribution():
-    """Create pie chart for complaint distribution by category"""
-    db_path = "/home/ubuntu/complaint_system/data/complaint_system.db"
-    model_path = "/home/ubuntu/complaint_system/models/classifier_model.pkl"
-    
-    service = ComplaintService(db_path, model_path)
     stats = service.get_statistics()
-    
-    categories = [item['category'] for item in stats['by_category']]
-    counts = [item['count'] for item in stats['by_category']]
+    with open(STATS_CACHE_PATH, 'w') as f:
+        json.dump({'db_mtime': mtime, 'stats': stats}, f)
+    return stats
+
+
+# Shared figure for the simple single-axes charts. Building a Figure and
+# Agg canvas costs tens of milliseconds in font and rcParams setup, so
+# repeat renders clear and reuse this one instead of allocating anew.
+_FIG = None
+
+
+def _reuse_fig(figsize):
+    """Return the shared figure, cleared and resized"""
+    global _FIG
+    if _FIG is None:
+        _FIG = plt.figure(figsize=figsize, constrained_layout=True)
+    else:
+        _FIG.clf()
+        _FIG.set_size_inches(figsize)
+    return _FIG
+
+
+def _warm_font_cache():
+    """Build the font cache once before the worker pool forks
+
+    The first text draw pays the font-manager scan; doing it in the
+    parent means every forked worker inherits the warm cache instead of
+    racing to rebuild it.
+    """
+    fig = plt.figure(figsize=(1, 1))
+    fig.text(0, 0, 'warm', weight='bold')
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def _unpack(rows, key):
+    """Split stats rows into typed label and count arrays
+
+    matplotlib gets contiguous ndarrays directly instead of coercing
+    Python lists internally.
+    """
+    labels = np.fromiter((r[key] for r in rows), dtype=object, count=len(rows))
+    counts = np.fromiter((r['count'] for r in rows), dtype=np.int64, count=len(rows))
+    return labels, counts
+
+
+def _is_cached(out_path):
+    """True when a static chart's PNG is newer than this script
+
+    The workflow, performance and comparison charts draw only
+    hard-coded data, so their output can only change when this file
+    does.
+    """
+    return (os.path.exists(out_path) and
+            os.path.getmtime(out_path) > os.path.getmtime(__file__))
+
+
+def _render(job):
+    """Render one chart in a worker process"""
+    fn, args = job
+    fn(*args)
+
+
+def create_category_distribution(stats):
+    """Create pie chart for complaint distribution by category"""
+    categories, counts = _unpack(stats['by_category'], 'category')
     
     colors = ['#3498db', '#e74c3c', '#f39c12', '#2ecc71', '#9b59b6']
     
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig, ax = plt.subplots(figsize=(10, 8), constrained_layout=True)
     wedges, texts, autotexts = ax.pie(
         counts, 
         labels=categories, 
@@ -45,109 +142,85 @@ def create_category_distribution():
     
     ax.set_title('Complaint Distribution by Category', fontsize=16, weight='bold', pad=20)
     
-    plt.tight_layout()
-    plt.savefig('/home/ubuntu/complaint_system/results/category_distribution.png', dpi=300, bbox_inches='tight')
+    plt.savefig('/home/ubuntu/complaint_system/results/category_distribution.png', **SAVE_KW)
     print("✓ Category distribution chart saved")
     plt.close()
 
 
-def create_priority_bar_chart():
+def create_priority_bar_chart(stats):
     """Create bar chart for complaints by priority"""
-    db_path = "/home/ubuntu/complaint_system/data/complaint_system.db"
-    model_path = "/home/ubuntu/complaint_system/models/classifier_model.pkl"
-    
-    service = ComplaintService(db_path, model_path)
-    stats = service.get_statistics()
-    
-    priorities = [item['priority'] for item in stats['by_priority']]
-    counts = [item['count'] for item in stats['by_priority']]
-    
+    priorities, counts = _unpack(stats['by_priority'], 'priority')
+
     # Sort by priority level
     priority_order = {'High': 0, 'Medium': 1, 'Low': 2}
-    sorted_data = sorted(zip(priorities, counts), key=lambda x: priority_order.get(x[0], 3))
-    priorities, counts = zip(*sorted_data)
+    order = np.argsort([priority_order.get(p, 3) for p in priorities], kind='stable')
+    priorities, counts = priorities[order], counts[order]
     
     colors = ['#e74c3c', '#f39c12', '#3498db']
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = _reuse_fig((10, 6))
+    ax = fig.add_subplot(111)
     bars = ax.bar(priorities, counts, color=colors, edgecolor='black', linewidth=1.5)
     
-    # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height)}',
-                ha='center', va='bottom', fontsize=12, weight='bold')
+    # bar_label lays out all the value labels in one vectorized call
+    ax.bar_label(bars, fmt='%d', padding=3, fontsize=12, weight='bold')
     
     ax.set_xlabel('Priority Level', fontsize=14, weight='bold')
     ax.set_ylabel('Number of Complaints', fontsize=14, weight='bold')
     ax.set_title('Complaints by Priority Level', fontsize=16, weight='bold', pad=20)
     ax.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('/home/ubuntu/complaint_system/results/priority_distribution.png', dpi=300, bbox_inches='tight')
+    fig.savefig('/home/ubuntu/complaint_system/results/priority_distribution.png', **SAVE_KW)
     print("✓ Priority distribution chart saved")
-    plt.close()
 
 
-def create_status_chart():
+def create_status_chart(stats):
     """Create horizontal bar chart for complaint status"""
-    db_path = "/home/ubuntu/complaint_system/data/complaint_system.db"
-    model_path = "/home/ubuntu/complaint_system/models/classifier_model.pkl"
-    
-    service = ComplaintService(db_path, model_path)
-    stats = service.get_statistics()
-    
-    statuses = [item['status'] for item in stats['by_status']]
-    counts = [item['count'] for item in stats['by_status']]
+    statuses, counts = _unpack(stats['by_status'], 'status')
     
     colors = ['#3498db', '#2ecc71', '#f39c12', '#e74c3c']
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = _reuse_fig((10, 6))
+    ax = fig.add_subplot(111)
     bars = ax.barh(statuses, counts, color=colors[:len(statuses)], edgecolor='black', linewidth=1.5)
     
     # Add value labels
-    for i, bar in enumerate(bars):
-        width = bar.get_width()
-        ax.text(width, bar.get_y() + bar.get_height()/2.,
-                f' {int(width)}',
-                ha='left', va='center', fontsize=12, weight='bold')
+    ax.bar_label(bars, fmt='%d', padding=3, fontsize=12, weight='bold')
     
     ax.set_xlabel('Number of Complaints', fontsize=14, weight='bold')
     ax.set_ylabel('Status', fontsize=14, weight='bold')
     ax.set_title('Complaints by Status', fontsize=16, weight='bold', pad=20)
     ax.grid(axis='x', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('/home/ubuntu/complaint_system/results/status_distribution.png', dpi=300, bbox_inches='tight')
+    fig.savefig('/home/ubuntu/complaint_system/results/status_distribution.png', **SAVE_KW)
     print("✓ Status distribution chart saved")
-    plt.close()
 
 
-def create_confusion_matrix():
+def create_confusion_matrix(cm, categories):
     """Create confusion matrix for classifier performance"""
-    model_path = "/home/ubuntu/complaint_system/models/classifier_model.pkl"
-    
-    classifier = ComplaintClassifier(model_path)
-    
-    # Retrain to get test data
-    accuracy, cm, y_test, y_pred = classifier.train(save_model=False)
-    
     # Create heatmap
-    fig, ax = plt.subplots(figsize=(10, 8))
-    
+    fig, ax = plt.subplots(figsize=(10, 8), constrained_layout=True)
+
     sns.heatmap(
-        cm, 
-        annot=True, 
-        fmt='d', 
+        cm,
+        annot=False,
         cmap='Blues',
-        xticklabels=classifier.categories,
-        yticklabels=classifier.categories,
+        xticklabels=categories,
+        yticklabels=categories,
         cbar_kws={'label': 'Count'},
         linewidths=0.5,
         linecolor='gray',
         ax=ax
     )
+
+    # Annotate by hand instead of annot=True: skips seaborn's per-cell
+    # formatting dispatch and leaves the zero cells (most of the
+    # off-diagonal) without a Text artist at all
+    threshold = cm.max() / 2
+    for (i, j), value in np.ndenumerate(cm):
+        if value:
+            ax.text(j + 0.5, i + 0.5, str(value), ha='center', va='center',
+                    color='white' if value > threshold else 'black')
     
     ax.set_xlabel('Predicted Category', fontsize=14, weight='bold')
     ax.set_ylabel('Actual Category', fontsize=14, weight='bold')
@@ -155,34 +228,27 @@ def create_confusion_matrix():
     
     plt.xticks(rotation=45, ha='right')
     plt.yticks(rotation=0)
-    plt.tight_layout()
-    plt.savefig('/home/ubuntu/complaint_system/results/confusion_matrix.png', dpi=300, bbox_inches='tight')
+    plt.savefig('/home/ubuntu/complaint_system/results/confusion_matrix.png',
+                **dict(SAVE_KW, dpi=300))
     print("✓ Confusion matrix saved")
     plt.close()
-    
-    return accuracy
 
 
-def create_classifier_accuracy_chart():
+def create_classifier_accuracy_chart(y_test, y_pred, categories):
     """Create chart showing classifier accuracy metrics"""
-    model_path = "/home/ubuntu/complaint_system/models/classifier_model.pkl"
-    
-    classifier = ComplaintClassifier(model_path)
-    accuracy, cm, y_test, y_pred = classifier.train(save_model=False)
-    
     # Calculate per-category metrics
     from sklearn.metrics import precision_recall_fscore_support
     
     precision, recall, f1, support = precision_recall_fscore_support(
-        y_test, y_pred, labels=classifier.categories, average=None
+        y_test, y_pred, labels=categories, average=None
     )
     
     # Create grouped bar chart
-    x = np.arange(len(classifier.categories))
+    x = np.arange(len(categories))
     width = 0.25
     
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
     bars1 = ax.bar(x - width, precision, width, label='Precision', color='#3498db')
     bars2 = ax.bar(x, recall, width, label='Recall', color='#2ecc71')
     bars3 = ax.bar(x + width, f1, width, label='F1-Score', color='#f39c12')
@@ -191,28 +257,27 @@ def create_classifier_accuracy_chart():
     ax.set_ylabel('Score', fontsize=14, weight='bold')
     ax.set_title('AI Classifier Performance Metrics by Category', fontsize=16, weight='bold', pad=20)
     ax.set_xticks(x)
-    ax.set_xticklabels(classifier.categories, rotation=45, ha='right')
+    ax.set_xticklabels(categories, rotation=45, ha='right')
     ax.legend(fontsize=12)
     ax.grid(axis='y', alpha=0.3)
     ax.set_ylim(0, 1.1)
     
     # Add value labels
-    for bars in [bars1, bars2, bars3]:
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height:.2f}',
-                        ha='center', va='bottom', fontsize=9)
-    
-    plt.tight_layout()
-    plt.savefig('/home/ubuntu/complaint_system/results/classifier_metrics.png', dpi=300, bbox_inches='tight')
+    for bars in (bars1, bars2, bars3):
+        ax.bar_label(bars, fmt='%.2f', fontsize=9)
+    
+    plt.savefig('/home/ubuntu/complaint_system/results/classifier_metrics.png', **SAVE_KW)
     print("✓ Classifier metrics chart saved")
     plt.close()
 
 
 def create_workflow_diagram():
     """Create a visual representation of the complaint workflow"""
+    out = '/home/ubuntu/complaint_system/results/workflow_diagram.png'
+    if _is_cached(out):
+        print("✓ Workflow diagram up to date, skipping")
+        return
+
     fig, ax = plt.subplots(figsize=(12, 8))
     ax.axis('off')
     
@@ -256,14 +321,18 @@ def create_workflow_diagram():
     ax.set_ylim(0, 1)
     ax.set_title('Smart Public Complaint Box - Workflow', fontsize=18, weight='bold', pad=20)
     
-    plt.tight_layout()
-    plt.savefig('/home/ubuntu/complaint_system/results/workflow_diagram.png', dpi=300, bbox_inches='tight')
+    plt.savefig(out, **SAVE_KW)
     print("✓ Workflow diagram saved")
     plt.close()
 
 
 def create_performance_metrics():
     """Create performance metrics visualization"""
+    out = '/home/ubuntu/complaint_system/results/performance_metrics.png'
+    if _is_cached(out):
+        print("✓ Performance metrics chart up to date, skipping")
+        return
+
     # Sample performance data
     metrics = {
         'Average Response Time': 2.75,  # ms
@@ -272,7 +341,8 @@ def create_performance_metrics():
         'System Uptime': 99.9  # percentage
     }
     
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10),
+                                                 constrained_layout=True)
     
     # Response Time Gauge
     ax1.barh(['Response Time'], [metrics['Average Response Time']], color='#3498db')
@@ -305,14 +375,18 @@ def create_performance_metrics():
             ha='center', va='center', fontsize=14, weight='bold', color='white')
     
     plt.suptitle('System Performance Metrics', fontsize=18, weight='bold', y=0.98)
-    plt.tight_layout()
-    plt.savefig('/home/ubuntu/complaint_system/results/performance_metrics.png', dpi=300, bbox_inches='tight')
+    plt.savefig(out, **SAVE_KW)
     print("✓ Performance metrics chart saved")
     plt.close()
 
 
 def create_comparison_chart():
     """Create comparison between traditional vs smart system"""
+    out = '/home/ubuntu/complaint_system/results/system_comparison.png'
+    if _is_cached(out):
+        print("✓ System comparison chart up to date, skipping")
+        return
+
     categories = ['Time to Submit', 'Processing Time', 'Transparency', 'User Satisfaction', 'Resolution Rate']
     traditional = [45, 72, 30, 40, 55]  # scores out of 100
     smart_system = [5, 12, 95, 90, 85]  # scores out of 100
@@ -320,8 +394,9 @@ def create_comparison_chart():
     x = np.arange(len(categories))
     width = 0.35
     
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
+    fig = _reuse_fig((12, 6))
+    ax = fig.add_subplot(111)
+
     bars1 = ax.bar(x - width/2, traditional, width, label='Traditional System', 
                    color='#e74c3c', edgecolor='black', linewidth=1.5)
     bars2 = ax.bar(x + width/2, smart_system, width, label='Smart System', 
@@ -337,32 +412,48 @@ def create_comparison_chart():
     ax.set_ylim(0, 110)
     
     # Add value labels
-    for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{int(height)}',
-                    ha='center', va='bottom', fontsize=10, weight='bold')
-    
-    plt.tight_layout()
-    plt.savefig('/home/ubuntu/complaint_system/results/system_comparison.png', dpi=300, bbox_inches='tight')
+    for bars in (bars1, bars2):
+        ax.bar_label(bars, fmt='%d', fontsize=10, weight='bold')
+    
+    fig.savefig(out, **SAVE_KW)
     print("✓ System comparison chart saved")
-    plt.close()
 
 
 if __name__ == "__main__":
     print("\n" + "="*70)
     print("GENERATING VISUALIZATIONS FOR PROJECT REPORT")
     print("="*70 + "\n")
-    
-    create_category_distribution()
-    create_priority_bar_chart()
-    create_status_chart()
-    accuracy = create_confusion_matrix()
-    create_classifier_accuracy_chart()
-    create_workflow_diagram()
-    create_performance_metrics()
-    create_comparison_chart()
+
+    db_path = "/home/ubuntu/complaint_system/data/complaint_system.db"
+    model_path = "/home/ubuntu/complaint_system/models/classifier_model.pkl"
+
+    # One service (one DB connection, one model load) and one statistics
+    # query shared by the three distribution charts
+    service = ComplaintService(db_path, model_path)
+    stats = cached_stats(service, db_path)
+
+    # A single evaluation run feeds both classifier charts; training
+    # twice with the same corpus would just repeat the fit
+    classifier = ComplaintClassifier(model_path)
+    accuracy, cm, y_test, y_pred = classifier.train(save_model=False, evaluate=True)
+
+    _warm_font_cache()
+
+    # Every chart is an independent Agg render + PNG encode, so they can
+    # rasterize in parallel; the shared stats and training results are
+    # computed once above and pickled out to the workers
+    jobs = [
+        (create_category_distribution, (stats,)),
+        (create_priority_bar_chart, (stats,)),
+        (create_status_chart, (stats,)),
+        (create_confusion_matrix, (cm, classifier.categories)),
+        (create_classifier_accuracy_chart, (y_test, y_pred, classifier.categories)),
+        (create_workflow_diagram, ()),
+        (create_performance_metrics, ()),
+        (create_comparison_chart, ()),
+    ]
+    with Pool(processes=min(len(jobs), os.cpu_count() or 1)) as pool:
+        pool.map(_render, jobs)
     
     print("\n" + "="*70)
     print("ALL VISUALIZATIONS GENERATED SUCCESSFULLY")